@@ -1,21 +1,64 @@
 #!/usr/bin/env python3
+# Only the cheap, always-needed modules are imported at the top level;
+# argparse, shutil and shlex are deferred to the code paths that use them
+# to keep cold-start interpreter time down.
 import os
-import shutil
+import re
+import stat
 import subprocess
-import argparse
 import sys
 
+# Accepts the two URL shapes GitHub hands out (https:// and git@ SSH),
+# requiring a host and a user/repo path so malformed URLs are rejected
+# before we ever spawn `git remote add`. The repo name (sans .git and any
+# trailing slash) is captured for the final success message.
+_URL_RE = re.compile(
+    r"^(?:https://[\w.-]+/[^/:]+/|git@[\w.-]+:[^/:]+/)"
+    r"(?P<name>[^/:]+?)(?:\.git)?/?$"
+)
+
+# --- Default .gitignore contents, loaded once at import ---
+# When installed as a package (including from a wheel or zipapp) the file
+# is read through importlib.resources; when run as a plain script we fall
+# back to the file sitting next to this one. Either way it is read exactly
+# once instead of being re-stat'ed and re-read on every run.
+try:
+    import importlib.resources
+
+    _IGNORE_BYTES = (
+        importlib.resources.files(__package__).joinpath("ignore.txt").read_bytes()
+    )
+except (FileNotFoundError, AttributeError, TypeError, ValueError, ImportError):
+    try:
+        with open(
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "ignore.txt"),
+            "rb",
+        ) as _f:
+            _IGNORE_BYTES = _f.read()
+    except OSError:
+        _IGNORE_BYTES = None
+
 # --- ANSI Color Codes for printing ---
-COLOR_CYAN = "\033[1;36m"
-COLOR_GREEN = "\033[1;32m"
-COLOR_YELLOW = "\033[1;33m"
-COLOR_RED = "\033[1;31m"
-COLOR_RESET = "\033[0m"
+# Only emit escape codes when stdout is a terminal; piped or redirected
+# output (CI logs, grep) gets plain text.
+_TTY = sys.stdout.isatty()
+COLOR_CYAN = "\033[1;36m" if _TTY else ""
+COLOR_GREEN = "\033[1;32m" if _TTY else ""
+COLOR_YELLOW = "\033[1;33m" if _TTY else ""
+COLOR_RED = "\033[1;31m" if _TTY else ""
+COLOR_RESET = "\033[0m" if _TTY else ""
+
+# Precomputed banner pieces so print_step avoids building an f-string
+# temporary for every step.
+_STEP_PREFIX = COLOR_CYAN + "==> "
+_STEP_SUFFIX = COLOR_RESET + "\n"
 
 
 def print_step(msg):
     """Prints a formatted step message in bold cyan."""
-    print(f"{COLOR_CYAN}==> {msg}{COLOR_RESET}")
+    sys.stdout.write(_STEP_PREFIX)
+    sys.stdout.write(msg)
+    sys.stdout.write(_STEP_SUFFIX)
 
 
 def print_success(msg):
@@ -34,12 +77,23 @@ def print_error(msg):
     sys.exit(1)
 
 
-def run_command(command, error_msg):
-    """Runs a command and handles potential errors."""
+def run_command(command, error_msg, capture_stdout=False):
+    """Runs a command and handles potential errors.
+
+    By default stdout goes to /dev/null rather than a pipe -- the git
+    commands we run are passed --quiet anyway, so allocating and draining
+    a pipe for it is wasted work. Only stderr is captured, for error
+    reporting. Pass capture_stdout=True to get the CompletedProcess back
+    with its stdout.
+    """
     try:
-        # We use capture_output=True to hide the command's stdout/stderr
-        # unless an error occurs.
-        subprocess.run(command, check=True, capture_output=True, text=True)
+        return subprocess.run(
+            command,
+            check=True,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
     except subprocess.CalledProcessError as e:
         # If the command fails, print its output for debugging
         print_error(f"{error_msg}\n--- Details ---\n{e.stderr.strip()}")
@@ -49,32 +103,89 @@ def run_command(command, error_msg):
         )
 
 
+# Cached result of the git version probe, filled in on first use.
+_GIT_HONORS_DEFAULT_BRANCH = None
+
+
+def git_honors_default_branch():
+    """Returns True if the installed git honors init.defaultBranch (>= 2.28).
+
+    The probe runs `git --version` once and caches the answer, so callers
+    can check it cheaply. If git is missing or the version can't be
+    parsed, we conservatively return False.
+    """
+    global _GIT_HONORS_DEFAULT_BRANCH
+    if _GIT_HONORS_DEFAULT_BRANCH is None:
+        import shutil
+
+        _GIT_HONORS_DEFAULT_BRANCH = False
+        if shutil.which("git"):
+            try:
+                output = subprocess.run(
+                    ["git", "--version"], capture_output=True, text=True, check=True
+                ).stdout
+                # Output looks like "git version 2.39.2" (possibly with a
+                # platform suffix on the last component).
+                major, minor = output.split()[2].split(".")[:2]
+                _GIT_HONORS_DEFAULT_BRANCH = (int(major), int(minor)) >= (2, 28)
+            except (subprocess.CalledProcessError, IndexError, ValueError):
+                pass
+    return _GIT_HONORS_DEFAULT_BRANCH
+
+
+def run_git_batch(script, error_msg):
+    """Runs several git commands as a single shell invocation.
+
+    Batching the local-only commands into one `bash -c` call avoids a
+    separate fork/exec (and git startup) for every step.
+    """
+    try:
+        subprocess.run(
+            ["bash", "-c", script],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except subprocess.CalledProcessError as e:
+        print_error(f"{error_msg}\n--- Details ---\n{e.stderr.strip()}")
+    except FileNotFoundError:
+        print_error("Command 'bash' not found. Is a POSIX shell available?")
+
+
 def main():
     """Main function to initialize the GitHub repository."""
-    parser = argparse.ArgumentParser(
-        description=(
-            "Initialize a new GitHub repository in a specified directory.\n\n"
-            "This script will:\n"
-            "  - Initialize a git repo\n"
-            "  - Add a .gitignore (from ignore.txt if present)\n"
-            "  - Add all files and make the first commit\n"
-            "  - Set the branch to main\n"
-            "  - Add a remote origin\n"
-            "  - Push to GitHub\n\n"
-            "Use --current to skip the directory prompt and use the current directory."
-        ),
-        # Use RawTextHelpFormatter to preserve newlines in the description
-        formatter_class=argparse.RawTextHelpFormatter,
-    )
-    parser.add_argument(
-        "--current",
-        action="store_true",
-        help="Use the current working directory instead of prompting for a directory.",
-    )
-    args = parser.parse_args()
+    # The only flags are --current and -h/--help, so check sys.argv
+    # directly and build the argparse parser only when help is requested;
+    # importing argparse costs more than everything else at startup.
+    argv = sys.argv[1:]
+    if "-h" in argv or "--help" in argv:
+        import argparse
+
+        parser = argparse.ArgumentParser(
+            description=(
+                "Initialize a new GitHub repository in a specified directory.\n\n"
+                "This script will:\n"
+                "  - Initialize a git repo\n"
+                "  - Add a .gitignore (from ignore.txt if present)\n"
+                "  - Add all files and make the first commit\n"
+                "  - Set the branch to main\n"
+                "  - Add a remote origin\n"
+                "  - Push to GitHub\n\n"
+                "Use --current to skip the directory prompt and use the current directory."
+            ),
+            # Use RawTextHelpFormatter to preserve newlines in the description
+            formatter_class=argparse.RawTextHelpFormatter,
+        )
+        parser.add_argument(
+            "--current",
+            action="store_true",
+            help="Use the current working directory instead of prompting for a directory.",
+        )
+        parser.parse_args()
 
     # --- 1. Determine Repository Directory ---
-    if args.current:
+    if "--current" in argv:
         repo_dir = os.getcwd()
         print_step(f"Using current working directory: {repo_dir}")
     else:
@@ -83,72 +194,105 @@ def main():
         if not repo_dir_input:
             print_error("Directory path cannot be empty.")
 
-        repo_dir = os.path.abspath(repo_dir_input)
-        if not os.path.isdir(repo_dir):
-            print_error(f"Directory does not exist: {repo_dir}")
-
-    # Change to the target directory
-    os.chdir(repo_dir)
-    print_step(f"Changed to directory: {repo_dir}")
-
-    # --- 2. Initialize Git and Create .gitignore ---
-    print_step("Initializing git repository")
-    run_command(["git", "init"], "Failed to initialize git.")
+        # A single stat answers both "does it exist" and "is it a
+        # directory" (isdir would stat again, abspath isn't needed since
+        # chdir resolves the path itself).
+        try:
+            st = os.stat(repo_dir_input)
+        except OSError:
+            print_error(f"Directory does not exist: {repo_dir_input}")
+        if not stat.S_ISDIR(st.st_mode):
+            print_error(f"Not a directory: {repo_dir_input}")
 
-    gitignore_path = os.path.join(repo_dir, ".gitignore")
+        # Change to the target directory
+        os.chdir(repo_dir_input)
+        repo_dir = os.getcwd()  # canonical form, one syscall
+        print_step(f"Changed to directory: {repo_dir}")
 
-    # Create an empty .gitignore file
-    with open(gitignore_path, "a"):
-        pass
-    print_step("Created .gitignore file")
+    # --- 2. Create .gitignore ---
+    # We already chdir'd into the repo, so a relative path is enough.
+    gitignore_path = ".gitignore"
 
-    # Copy ignore.txt from script's directory to .gitignore if it exists
+    # Write the cached ignore.txt contents to .gitignore if we have them
     try:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        ignore_txt_path = os.path.join(script_dir, "ignore.txt")
-
-        if os.path.exists(ignore_txt_path):
-            shutil.copyfile(ignore_txt_path, gitignore_path)
+        if _IGNORE_BYTES is not None:
+            with open(gitignore_path, "wb") as dst:
+                dst.write(_IGNORE_BYTES)
             print_step("Copied ignore.txt to .gitignore successfully")
         else:
-            print_warning(
-                f"ignore.txt not found in {script_dir}, so .gitignore is empty."
-            )
+            # Still create an (empty) .gitignore so the repo has one.
+            with open(gitignore_path, "a"):
+                pass
+            print_warning("ignore.txt not found, so .gitignore is empty.")
     except Exception as e:
         print_warning(f"Could not process ignore.txt. Error: {e}")
 
-    # --- 3. Git Commit and Branch ---
-    print_step("Adding all files to git")
-    run_command(["git", "add", "."], "Failed to add files.")
-
-    print_step("Creating initial commit")
-    run_command(
-        ["git", "commit", "-m", "first commit"],
-        "Failed to create initial commit. Are there any files to commit?",
+    # --- 3. Git Init, Commit, Branch and Remote ---
+    # Kick off init + add in the background so staging a large working
+    # tree overlaps with the user typing the URL. Both batches run in a
+    # single shell instead of paying git's startup cost for every step,
+    # and creating the repo with init.defaultBranch=main saves a separate
+    # `git branch -M` (kept only as a fallback for git older than 2.28).
+    print_step("Initializing git repository and staging files")
+    add_proc = subprocess.Popen(
+        ["bash", "-c", "git -c init.defaultBranch=main init --quiet && git add ."],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
     )
 
-    print_step("Renaming branch to 'main'")
-    run_command(["git", "branch", "-M", "main"], "Failed to rename branch.")
-
-    # --- 4. Git Remote and Push ---
     repo_url = input(
         "Enter the GitHub repository URL (e.g., https://github.com/user/repo.git): "
     ).strip()
-    if not repo_url.startswith("https://") and not repo_url.startswith("git@"):
+    url_match = _URL_RE.match(repo_url)
+    if not url_match:
         print_error("Invalid repository URL format.")
 
+    _, add_stderr = add_proc.communicate()
+    if add_proc.returncode != 0:
+        print_error(
+            f"Failed to initialize git and add files.\n--- Details ---\n"
+            f"{add_stderr.strip()}"
+        )
+
     print_step(f"Adding remote origin: {repo_url}")
     run_command(
         ["git", "remote", "add", "origin", repo_url],
         "Failed to add remote 'origin'. Does it already exist?",
     )
 
-    # This step is useful if the remote repo was created with a README or license.
-    # It might fail if the remote is completely empty, which is fine.
-    print_step("Attempting to pull and rebase from origin/main (if it exists)")
-    try:
+    # The initial commit (local CPU and disk work) and the origin/main
+    # probe (network) are independent once the remote exists, so run them
+    # concurrently: the round-trip to GitHub hides behind object writing.
+    # Only the commit thread touches the index, so there is no race.
+    from concurrent.futures import ThreadPoolExecutor
+
+    print_step("Creating initial commit and checking for origin/main")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        commit_future = executor.submit(
+            run_git_batch,
+            "git commit --quiet -m 'first commit'"
+            + ("" if git_honors_default_branch() else " && git branch -M main"),
+            "Failed to create initial commit. Are there any files to commit?",
+        )
+        ls_future = executor.submit(
+            subprocess.run,
+            ["git", "ls-remote", "--heads", "origin", "main"],
+            capture_output=True,
+            text=True,
+        )
+        commit_future.result()
+        ls = ls_future.result()
+
+    # --- 4. Git Pull and Push ---
+    # Pulling is only useful if the remote repo was created with a README
+    # or license. The ls-remote probe above only transfers refs, so for
+    # the common brand-new-empty-repo case we skip the full (and
+    # guaranteed-to-fail) pull round-trip entirely.
+    if ls.stdout.strip():
         # We also need to specify --allow-unrelated-histories for the initial pull
-        subprocess.run(
+        print_step("Pulling and rebasing from origin/main")
+        run_command(
             [
                 "git",
                 "pull",
@@ -157,22 +301,16 @@ def main():
                 "main",
                 "--allow-unrelated-histories",
             ],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except subprocess.CalledProcessError:
-        print_warning(
-            "Could not pull from remote. This is normal for a brand new empty repository."
+            "Failed to rebase onto the existing origin/main.",
         )
 
     print_step("Pushing to GitHub and setting upstream")
     run_command(
-        ["git", "push", "--set-upstream", "origin", "main"],
+        ["git", "push", "--quiet", "--set-upstream", "origin", "main"],
         "Failed to push to GitHub. Check your URL and permissions.",
     )
 
-    repo_name = os.path.basename(repo_url.rstrip("/").replace(".git", ""))
+    repo_name = url_match.group("name")
     print_success(
         f"GitHub repository '{repo_name}' has been set up successfully in '{repo_dir}'!"
     )